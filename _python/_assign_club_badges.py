@@ -48,44 +48,59 @@ def extract_id(filename: str):
     return m.group(1) if m else None
 
 
-def main():
-    id_map = load_id_map()
-
+def plan_renames(files, id_map):
+    """
+    Work out (old_path, new_path) pairs without touching the disk.
+    """
     # Group files by club ID
     files_by_id = {}
+    skipped = []
 
-    for file in LOGO_DIR.iterdir():
+    for file in files:
         if file.suffix.lower() not in IMAGE_EXTS:
             continue
 
         cid = extract_id(file.name)
         if not cid or cid not in id_map:
-            print(f"[SKIP] {file.name}")
+            skipped.append(file)
             continue
 
         files_by_id.setdefault(cid, []).append(file)
 
-    # Rename
-    for cid, files in files_by_id.items():
+    plan = []
+    for cid, group in files_by_id.items():
         club_name = id_map[cid]
 
         # Sort for stable numbering
-        files.sort(key=lambda f: f.name)
+        group.sort(key=lambda f: f.name)
 
-        for idx, file in enumerate(files, start=1):
-            if len(files) == 1:
+        for idx, file in enumerate(group, start=1):
+            if len(group) == 1:
                 new_name = f"{club_name}_retro{file.suffix}"
             else:
                 new_name = f"{club_name}_retro{idx}{file.suffix}"
 
-            new_path = file.with_name(new_name)
+            plan.append((file, file.with_name(new_name)))
+
+    return plan, skipped
+
 
-            if new_path.exists():
-                print(f"[COLLISION] {new_name} already exists — skipping")
-                continue
+def main():
+    id_map = load_id_map()
+
+    plan, skipped = plan_renames(LOGO_DIR.iterdir(), id_map)
+
+    for file in skipped:
+        print(f"[SKIP] {file.name}")
+
+    # Rename
+    for file, new_path in plan:
+        if new_path.exists():
+            print(f"[COLLISION] {new_path.name} already exists — skipping")
+            continue
 
-            file.rename(new_path)
-            print(f"[RENAMED] {file.name} -> {new_name}")
+        file.rename(new_path)
+        print(f"[RENAMED] {file.name} -> {new_path.name}")
 
     print("\n=== DONE ===")
 
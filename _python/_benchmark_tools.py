@@ -0,0 +1,353 @@
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import _assign_club_badges
+import _clean_aliases
+import _create_logo_assignment
+import _rename_badges
+
+# ================= CONFIG =================
+# Next to this script, whatever directory it is run from. Results are
+# per-run and git-ignored; the baseline is meant to be committed once
+# recorded on the reference machine.
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_FILE = BENCH_DIR / "bench_results.json"
+BASELINE_FILE = BENCH_DIR / "bench_baseline.json"
+
+# name: (clubs, logos, id map lines, wiki club pages)
+SCALES = {
+    "small": (100, 250, 5_000, 20),
+    "medium": (1_000, 2_500, 50_000, 100),
+    "large": (5_000, 15_000, 250_000, 400),
+}
+
+REPEATS = 5                  # best-of-N wall time
+REGRESSION_THRESHOLD = 0.25  # fail if >25% slower than baseline
+NOISE_FLOOR = {"seconds": 0.005, "peak_kib": 64}  # ignore smaller absolute changes
+UPDATE_BASELINE = False      # True = replace the baseline for the scales run
+SEED = 2024
+# =========================================
+
+LEAGUES = ["PL", "CH", "L1", "L2", "NL", "SP", "SC", "SL1", "SL2", "CP", "PD", "FD", "NIP"]
+
+WORDS = [
+    "athletic", "rovers", "wanderers", "albion", "county", "north", "south",
+    "park", "rangers", "harriers", "borough", "saints", "villa", "orient",
+    "hotspur", "vale", "forest", "celtic", "thistle", "academical",
+]
+PLACES = [
+    "ashford", "bexley", "carrow", "dunmore", "elmfield", "fairhaven",
+    "glenrock", "hartley", "inverby", "kilbride", "lowmoor", "marston",
+    "newbury", "oakridge", "penrith", "queensway", "redcliffe", "stanmore",
+    "thornbury", "ulverston", "westholm", "yarrow",
+]
+SUFFIXES = ["FC", "AFC", "United", "City", "Town", ""]
+
+# Which match_logo stage each club is built to exercise, by index % 10:
+# 40% exact stem, 20% containment, 20% base-name (stopwords dropped),
+# 10% token overlap (reordered tokens), 10% no logo at all (miss).
+STAGES = ["exact"] * 4 + ["contains"] * 2 + ["base"] * 2 + ["overlap", "miss"]
+
+
+# ---------- fixtures ----------
+def club_name(rng, i: int, suffixes=SUFFIXES) -> str:
+    parts = [rng.choice(PLACES).title(), rng.choice(WORDS).title(), rng.choice(suffixes)]
+    # zero-padded index keeps names unique and stops "x_1" matching inside "x_12"
+    return f"{' '.join(p for p in parts if p)} {i:07d}"
+
+
+def make_clubs(rng, n: int):
+    clubs = []
+    for i in range(n):
+        stage = STAGES[i % len(STAGES)]
+        if stage == "base":
+            # needs a stopword, otherwise the base name is the full name
+            name = club_name(rng, i, [s for s in SUFFIXES if s])
+        elif stage == "miss":
+            # no token shared with any logo, so even overlap scoring fails
+            name = f"Nowhere{i:07d} Vagrants{i:07d}"
+        else:
+            name = club_name(rng, i)
+        base = name.lower()
+        clubs.append({
+            "id": base.replace(" ", "_"),
+            "name": name,
+            "league": rng.choice(LEAGUES),
+            "stage": stage,
+            # mix of long and short aliases so cleaning has work to do
+            "aliases": [base, base.split()[0], "".join(w[0] for w in base.split()), f"fc{i}"],
+        })
+    return clubs
+
+
+def logo_stem(club) -> str:
+    """
+    A file name that only the club's intended match_logo stage will find.
+    """
+    norm = _create_logo_assignment.normalise(club["name"])
+    tokens = _create_logo_assignment.tokens(club["name"])
+    stage = club["stage"]
+
+    if stage == "contains":
+        return f"{norm}_badge"
+    if stage == "base":
+        return "_".join(tokens) + "_crest"
+    if stage == "overlap":
+        return "_".join(reversed(tokens))
+    return norm
+
+
+def make_logos(rng, root: Path, clubs, m: int):
+    """
+    Empty files are enough: every matcher works on names only.
+    """
+    for league in LEAGUES:
+        (root / league).mkdir(parents=True, exist_ok=True)
+
+    with_logo = [c for c in clubs if c["stage"] != "miss"]
+    for i in range(m):
+        club = with_logo[i % len(with_logo)]
+        stem = logo_stem(club)
+        if i >= len(with_logo):
+            stem = f"{stem}_retro{i // len(with_logo)}"
+        ext = rng.choice([".png", ".png", ".png", ".svg"])
+        (root / club["league"] / f"{stem}{ext}").touch()
+
+
+def make_id_map(rng, path: Path, clubs, k: int):
+    lines = []
+    for i in range(k):
+        name = clubs[i]["name"] if i < len(clubs) else club_name(rng, i)
+        lines.append(f"{1_000_000 + i}|{name}")
+        # the real PDF extract has stray junk lines too
+        if i % 500 == 0:
+            lines.append("Page header without a separator")
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def make_raw_badges(root: Path, k: int, files: int):
+    """
+    FMG-style numeric badge names, some with several versions per club.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    for i in range(files):
+        cid = 1_000_000 + (i * 7919) % (k * 2)  # about half unknown IDs
+        version = f"_{i % 3}" if i % 4 == 0 else ""
+        (root / f"{cid}{version}.png").touch()
+
+
+def make_wiki_pages(rng, clubs, pages: int):
+    """
+    Recorded-style Wikipedia HTML, keyed by URL, for the scraper parsers.
+    """
+    wiki = _generate_clubs().WIKI
+    rows = []
+    recorded = {}
+
+    for i, club in enumerate(clubs[:pages]):
+        slug = club["name"].replace(" ", "_")
+        rows.append(
+            f'<tr><td>{i + 1}</td><td><a href="/wiki/{slug}_F.C.">{club["name"]}</a></td>'
+            f"<td>{rng.randint(10, 40)}</td><td>{rng.randint(0, 90)}</td></tr>"
+        )
+        ground = f"{slug}_Stadium"
+        filler = "".join(
+            f"<tr><th>Field {j}</th><td>{' '.join(rng.choices(WORDS, k=12))}</td></tr>"
+            for j in range(25)
+        )
+        recorded[f"{wiki}/wiki/{slug}_F.C."] = (
+            "<html><body><p>" + " ".join(rng.choices(WORDS, k=400)) + "</p>"
+            '<table class="infobox vcard">'
+            f"<tr><th>Full name</th><td>{club['name']}</td></tr>{filler}"
+            f'<tr><th>Ground</th><td><a href="/wiki/{ground}">{club["name"]} Stadium</a></td></tr>'
+            "</table></body></html>"
+        )
+        recorded[f"{wiki}/wiki/{ground}"] = (
+            "<html><body><p>" + " ".join(rng.choices(WORDS, k=400)) + "</p>"
+            f'<span class="geo">{rng.uniform(50, 58):.5f}; {rng.uniform(-6, 1):.5f}</span>'
+            "</body></html>"
+        )
+
+    league_url = f"{wiki}/wiki/Synthetic_League"
+    recorded[league_url] = (
+        '<html><body><table class="wikitable">'
+        "<tr><th>Pos</th><th>Team</th><th>Pld</th><th>Pts</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+    return league_url, recorded
+
+
+def _generate_clubs():
+    # Needs requests + bs4; imported late so the other benchmarks still run
+    import _generate_clubs as module
+    return module
+
+
+# ---------- measurement ----------
+def measure(fn):
+    """
+    Best-of-REPEATS wall time, plus peak Python allocations of one run.
+    """
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"seconds": round(best, 6), "peak_kib": round(peak / 1024, 1)}
+
+
+def bench_scale(name: str, work: Path):
+    n_clubs, n_logos, k_lines, n_pages = SCALES[name]
+    rng = random.Random(SEED)
+
+    clubs = make_clubs(rng, max(n_clubs, 1))
+    logo_root = work / "club_logos_by_league"
+    make_logos(rng, logo_root, clubs, n_logos)
+    id_map_file = work / "club_id_map.txt"
+    make_id_map(rng, id_map_file, clubs, k_lines)
+    raw_dir = work / "raw_badges"
+    make_raw_badges(raw_dir, k_lines, n_logos)
+    clubs_json = work / "clubs.json"
+    clubs_json.write_text(json.dumps(clubs), encoding="utf-8")
+
+    # Point the tools at the fixtures
+    _assign_club_badges.ID_MAP_FILE = id_map_file
+    _rename_badges.CLUBS_JSON = clubs_json
+
+    results = {}
+
+    results["id_map_load"] = measure(_assign_club_badges.load_id_map)
+
+    def logo_matching():
+        logos = _create_logo_assignment.load_logos(logo_root)
+        for club in clubs:
+            _create_logo_assignment.match_logo(club["name"], club["league"], logos)
+
+    results["logo_matching"] = measure(logo_matching)
+
+    def alias_cleaning():
+        data = json.loads(clubs_json.read_text(encoding="utf-8"))
+        _clean_aliases.clean_aliases(data)
+
+    results["alias_cleaning"] = measure(alias_cleaning)
+
+    id_map = _assign_club_badges.load_id_map()
+    raw_files = sorted(raw_dir.iterdir())
+    named_files = sorted(p for p in logo_root.rglob("*") if p.is_file())
+
+    def rename_planning():
+        _assign_club_badges.plan_renames(raw_files, id_map)
+        # the name-based <club>_retroN files, not the numeric dump
+        _rename_badges.plan_moves(named_files, _rename_badges.load_club_names())
+
+    results["rename_planning"] = measure(rename_planning)
+
+    try:
+        gen = _generate_clubs()
+    except ImportError as e:
+        print(f"  [SKIP] wiki_parsing ({e})")
+    else:
+        league_url, recorded = make_wiki_pages(rng, clubs, n_pages)
+        gen.http_get = lambda url, timeout=30: recorded[url]  # offline
+
+        def wiki_parsing():
+            for _, club_url in gen.scrape_club_links_from_league(league_url):
+                ground = gen.find_home_ground_link(club_url)
+                if ground and ground[1]:
+                    gen.extract_coords_from_wiki_page(ground[1])
+
+        results["wiki_parsing"] = measure(wiki_parsing)
+
+    return results
+
+
+def compare(results, baseline):
+    """
+    Returns a list of regression messages (empty = all good).
+    """
+    regressions = []
+    for scale, benches in results.items():
+        for bench, now in benches.items():
+            before = baseline.get(scale, {}).get(bench)
+            if not before:
+                print(f"  [NEW] {scale}/{bench}")
+                continue
+
+            for metric in ("seconds", "peak_kib"):
+                if not before[metric]:
+                    continue
+                change = now[metric] / before[metric] - 1
+                if now[metric] - before[metric] < NOISE_FLOOR[metric]:
+                    continue
+                if change > REGRESSION_THRESHOLD:
+                    regressions.append(
+                        f"{scale}/{bench} {metric}: {before[metric]} -> {now[metric]} (+{change:.0%})"
+                    )
+    return regressions
+
+
+def main():
+    scales = sys.argv[1:] or list(SCALES)
+    unknown = [name for name in scales if name not in SCALES]
+    if unknown:
+        raise SystemExit(f"usage: _benchmark_tools.py [{'|'.join(SCALES)} ...] (unknown: {', '.join(unknown)})")
+
+    results = {}
+
+    for name in scales:
+        print(f"\nScale: {name} {SCALES[name]}")
+        work = Path(tempfile.mkdtemp(prefix=f"bench_{name}_"))
+        try:
+            results[name] = bench_scale(name, work)
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+        for bench, r in results[name].items():
+            print(f"  {bench:<16} {r['seconds'] * 1000:>10.1f} ms  {r['peak_kib']:>10.1f} KiB")
+
+    RESULTS_FILE.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\nWritten {RESULTS_FILE.resolve()}")
+
+    baseline = {}
+    if BASELINE_FILE.exists():
+        baseline = json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+
+    # Only the scales that ran are replaced; the rest of the baseline stays
+    missing = [name for name in results if name not in baseline]
+    if UPDATE_BASELINE or missing:
+        saved = list(results) if UPDATE_BASELINE else missing
+        updated = dict(baseline)
+        updated.update({name: results[name] for name in saved})
+        BASELINE_FILE.write_text(json.dumps(updated, indent=2), encoding="utf-8")
+        print(f"Baseline for {', '.join(saved)} saved to {BASELINE_FILE.resolve()}")
+        if UPDATE_BASELINE:
+            return
+
+    regressions = compare(results, baseline)
+
+    print("\n=== SUMMARY ===")
+    if not regressions:
+        print(f"No regressions over {REGRESSION_THRESHOLD:.0%}")
+        return
+
+    for msg in regressions:
+        print(f"[REGRESSION] {msg}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
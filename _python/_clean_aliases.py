@@ -3,20 +3,31 @@ import json
 # Path to your clubs.json file
 file_path = "clubs.json"
 
-# Load the JSON data
-with open(file_path, "r", encoding="utf-8") as f:
-    clubs = json.load(f)
-
 # Minimum alias length to keep
 MIN_ALIAS_LENGTH = 5
 
-# Process each club
-for club in clubs:
-    if "aliases" in club:
-        club["aliases"] = [alias for alias in club["aliases"] if len(alias.strip()) >= MIN_ALIAS_LENGTH]
 
-# Save the cleaned data
-with open(file_path, "w", encoding="utf-8") as f:
-    json.dump(clubs, f, indent=2, ensure_ascii=False)
+def clean_aliases(clubs, min_length=MIN_ALIAS_LENGTH):
+    # Process each club
+    for club in clubs:
+        if "aliases" in club:
+            club["aliases"] = [alias for alias in club["aliases"] if len(alias.strip()) >= min_length]
+    return clubs
+
+
+def main():
+    # Load the JSON data
+    with open(file_path, "r", encoding="utf-8") as f:
+        clubs = json.load(f)
+
+    clean_aliases(clubs)
+
+    # Save the cleaned data
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(clubs, f, indent=2, ensure_ascii=False)
+
+    print("Short aliases removed. Updated clubs.json saved.")
+
 
-print("Short aliases removed. Updated clubs.json saved.")
+if __name__ == "__main__":
+    main()
@@ -31,38 +31,28 @@ def tokens(text: str):
     ]
 
 # ---------- load all logos ----------
-logos = []
+def load_logos(root: Path = LOGO_ROOT):
+    logos = []
 
-for league_dir in LOGO_ROOT.iterdir():
-    if not league_dir.is_dir():
-        continue
+    for league_dir in root.iterdir():
+        if not league_dir.is_dir():
+            continue
 
-    league = league_dir.name
+        league = league_dir.name
 
-    for file in league_dir.iterdir():
-        if file.suffix.lower() in IMAGE_EXTS:
-            logos.append({
-                "league": league,
-                "path": f"club_logos_by_league/{league}/{file.name}",
-                "stem": normalise(file.stem),
-                "tokens": set(tokens(file.stem))
-            })
+        for file in league_dir.iterdir():
+            if file.suffix.lower() in IMAGE_EXTS:
+                logos.append({
+                    "league": league,
+                    "path": f"club_logos_by_league/{league}/{file.name}",
+                    "stem": normalise(file.stem),
+                    "tokens": set(tokens(file.stem))
+                })
 
-print(f"Loaded {len(logos)} logos")
-
-# ---------- load clubs ----------
-clubs = json.loads(CLUBS_JSON.read_text(encoding="utf-8"))
-
-matched = 0
-missing = 0
-
-for club in clubs:
-    name = club.get("name")
-    league = club.get("league")
-
-    if not name or not league:
-        continue
+    return logos
 
+# ---------- match one club ----------
+def match_logo(name: str, league: str, logos):
     club_norm = normalise(name)
     club_tokens = set(tokens(name))
 
@@ -103,20 +93,44 @@ for club in clubs:
         if best_score < 1:
             best = None
 
-    if best:
-        club["logo"] = best["path"]
-        matched += 1
-        print(f"[OK] {name} -> {best['path']}")
-    else:
-        missing += 1
-        print(f"[MISS] {name}")
-
-# ---------- write back ----------
-CLUBS_JSON.write_text(
-    json.dumps(clubs, indent=2),
-    encoding="utf-8"
-)
-
-print("\n=== SUMMARY ===")
-print(f"Logos added: {matched}")
-print(f"Still missing: {missing}")
+    return best
+
+def main():
+    logos = load_logos()
+    print(f"Loaded {len(logos)} logos")
+
+    # ---------- load clubs ----------
+    clubs = json.loads(CLUBS_JSON.read_text(encoding="utf-8"))
+
+    matched = 0
+    missing = 0
+
+    for club in clubs:
+        name = club.get("name")
+        league = club.get("league")
+
+        if not name or not league:
+            continue
+
+        best = match_logo(name, league, logos)
+
+        if best:
+            club["logo"] = best["path"]
+            matched += 1
+            print(f"[OK] {name} -> {best['path']}")
+        else:
+            missing += 1
+            print(f"[MISS] {name}")
+
+    # ---------- write back ----------
+    CLUBS_JSON.write_text(
+        json.dumps(clubs, indent=2),
+        encoding="utf-8"
+    )
+
+    print("\n=== SUMMARY ===")
+    print(f"Logos added: {matched}")
+    print(f"Still missing: {missing}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+import json
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+# ================= CONFIG =================
+LOGO_ROOT = Path(
+    r"C:\Users\44752\Desktop\Football\club_logos_by_league"
+)
+
+# Near-duplicates are moved here when COLLAPSE is on (nothing is deleted)
+DUPLICATES_DIR = Path(
+    r"C:\Users\44752\Desktop\Football\logo_duplicates"
+)
+
+# Copies referenced by a club's "logo" are never moved
+CLUBS_JSON = Path(
+    r"C:\Users\44752\Desktop\Football\clubs.json"
+)
+
+# Hashes keyed by path, reused while mtime + size are unchanged
+CACHE_FILE = Path(
+    r"C:\Users\44752\Desktop\Football\logo_hashes.json"
+)
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg"}
+UNHASHED_EXTS = {".svg"}  # badges too, but Pillow can't rasterise them
+
+MAX_PHASH_DISTANCE = 6   # bits out of 64
+MAX_DHASH_DISTANCE = 10  # second opinion, stops pHash false positives
+COLLAPSE = False         # False = report only
+WORKERS = None           # None = one per CPU
+# =========================================
+
+HASH_SIZE = 8
+DCT_SIZE = 32
+
+# Precomputed DCT-II basis for the low frequencies pHash keeps
+DCT_BASIS = [
+    [math.cos(math.pi * (2 * x + 1) * u / (2 * DCT_SIZE)) for x in range(DCT_SIZE)]
+    for u in range(HASH_SIZE)
+]
+
+
+def load_greyscale(path: Path, size) -> list:
+    """
+    Flatten transparency onto white so badges with different alpha
+    backgrounds still compare equal, then shrink to a greyscale grid.
+    """
+    with Image.open(path) as img:
+        img = img.convert("RGBA")
+        bg = Image.new("RGBA", img.size, (255, 255, 255, 255))
+        bg.alpha_composite(img)
+        small = bg.convert("L").resize(size, Image.LANCZOS)
+        return list(small.getdata())
+
+
+def bits_to_int(bits) -> int:
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value
+
+
+def dhash(path: Path) -> int:
+    """
+    Difference hash: is each pixel brighter than its right-hand neighbour?
+    """
+    w = HASH_SIZE + 1
+    px = load_greyscale(path, (w, HASH_SIZE))
+    bits = []
+    for row in range(HASH_SIZE):
+        for col in range(HASH_SIZE):
+            bits.append(px[row * w + col] > px[row * w + col + 1])
+    return bits_to_int(bits)
+
+
+def phash(path: Path) -> int:
+    """
+    Perceptual hash: top-left 8x8 DCT coefficients of a 32x32 thumbnail,
+    each compared against their median (DC term excluded).
+    """
+    px = load_greyscale(path, (DCT_SIZE, DCT_SIZE))
+    rows = [px[r * DCT_SIZE:(r + 1) * DCT_SIZE] for r in range(DCT_SIZE)]
+
+    # Separable DCT: rows first, then columns, low frequencies only
+    row_dct = [
+        [sum(b * p for b, p in zip(basis, row)) for basis in DCT_BASIS]
+        for row in rows
+    ]
+    coeffs = []
+    for v in range(HASH_SIZE):
+        basis = DCT_BASIS[v]
+        for u in range(HASH_SIZE):
+            coeffs.append(sum(basis[y] * row_dct[y][u] for y in range(DCT_SIZE)))
+
+    median = sorted(coeffs[1:])[len(coeffs[1:]) // 2]
+    return bits_to_int(c > median for c in coeffs)
+
+
+def hash_file(path_str: str):
+    """
+    Worker entry point (must stay top-level so it pickles on Windows).
+    """
+    path = Path(path_str)
+    try:
+        return path_str, phash(path), dhash(path), None
+    except Exception as e:
+        return path_str, None, None, str(e)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over Hamming distance.
+    Each node: [hash, [paths], {distance: child}]
+    """
+
+    def __init__(self):
+        self.root = None
+
+    def add(self, h: int, path: str):
+        if self.root is None:
+            self.root = [h, [path], {}]
+            return
+
+        node = self.root
+        while True:
+            d = hamming(h, node[0])
+            if d == 0:
+                node[1].append(path)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [h, [path], {}]
+                return
+            node = child
+
+    def query(self, h: int, max_dist: int):
+        """
+        Yield (distance, path) for every entry within max_dist of h.
+        """
+        if self.root is None:
+            return
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            d = hamming(h, node[0])
+            if d <= max_dist:
+                for path in node[1]:
+                    yield d, path
+            for child_d, child in node[2].items():
+                if d - max_dist <= child_d <= d + max_dist:
+                    stack.append(child)
+
+
+def load_cache():
+    if not CACHE_FILE.exists():
+        return {}
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        print(f"[WARN] Unreadable cache {CACHE_FILE.name} — rehashing everything")
+        return {}
+
+
+def save_cache(cache):
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def collect_files():
+    """
+    Returns (hashable images, badges that can't be hashed).
+    """
+    images, unhashed = [], []
+    for p in sorted(LOGO_ROOT.rglob("*")):
+        if not p.is_file():
+            continue
+        if p.suffix.lower() in IMAGE_EXTS:
+            images.append(p)
+        elif p.suffix.lower() in UNHASHED_EXTS:
+            unhashed.append(p)
+    return images, unhashed
+
+
+def load_referenced():
+    """
+    Paths clubs.json points at, as keys comparable with the hash keys.
+    Logos are stored as "club_logos_by_league/<league>/<file>".
+    """
+    clubs = json.loads(CLUBS_JSON.read_text(encoding="utf-8"))
+    referenced = set()
+    for club in clubs:
+        parts = Path(club.get("logo") or "").parts
+        if len(parts) > 1:
+            referenced.add(str(LOGO_ROOT.joinpath(*parts[1:])))
+    return referenced
+
+
+def compute_hashes(files):
+    """
+    Returns {path_str: (phash, dhash)}. Only new/changed files are hashed.
+    """
+    cache = load_cache()
+    hashes = {}
+    todo = []
+
+    for file in files:
+        key = str(file)
+        st = file.stat()
+        entry = cache.get(key)
+        if entry and entry["mtime"] == st.st_mtime and entry["size"] == st.st_size:
+            hashes[key] = (int(entry["phash"], 16), int(entry["dhash"], 16))
+        else:
+            todo.append(key)
+
+    print(f"Cached: {len(hashes)}  To hash: {len(todo)}")
+
+    if todo:
+        workers = WORKERS or os.cpu_count() or 1
+        chunk = max(1, len(todo) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for key, ph, dh, err in pool.map(hash_file, todo, chunksize=chunk):
+                if err:
+                    print(f"[ERROR] {Path(key).name} ({err})")
+                    continue
+                st = Path(key).stat()
+                hashes[key] = (ph, dh)
+                cache[key] = {
+                    "mtime": st.st_mtime,
+                    "size": st.st_size,
+                    "phash": f"{ph:016x}",
+                    "dhash": f"{dh:016x}",
+                }
+
+    # Drop entries for files that no longer exist
+    live = {str(f) for f in files}
+    for key in list(cache):
+        if key not in live:
+            del cache[key]
+
+    save_cache(cache)
+    return hashes
+
+
+def is_near(a, b) -> bool:
+    """
+    a, b are (phash, dhash) pairs.
+    """
+    return (
+        hamming(a[0], b[0]) <= MAX_PHASH_DISTANCE
+        and hamming(a[1], b[1]) <= MAX_DHASH_DISTANCE
+    )
+
+
+def find_groups(hashes):
+    """
+    Union-find over every pair the BK-tree says is close enough.
+    Groups are transitive (A~B~C), so A and C may be far apart; main()
+    re-checks each copy against the one it keeps before moving it.
+    """
+    tree = BKTree()
+    for path, (ph, _) in hashes.items():
+        tree.add(ph, path)
+
+    parent = {p: p for p in hashes}
+
+    def root(p):
+        while parent[p] != p:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    for path, (ph, dh) in hashes.items():
+        for _, other in tree.query(ph, MAX_PHASH_DISTANCE):
+            if other == path:
+                continue
+            if not is_near((ph, dh), hashes[other]):
+                continue
+            a, b = root(path), root(other)
+            if a != b:
+                parent[b] = a
+
+    groups = {}
+    for path in hashes:
+        groups.setdefault(root(path), []).append(path)
+    return [sorted(g) for g in groups.values() if len(g) > 1]
+
+
+# Only what the badge tools append: _retroN (_assign_club_badges) and
+# _club / _club_N (_rename_badges). Plain trailing numbers like
+# schalke_04 are part of the name.
+COPY_SUFFIX_RE = re.compile(r"(_retro\d*|_club(_\d+)?)$")
+
+
+def club_key(path_str: str) -> str:
+    """
+    burnley_retro2 / burnley_club_1 / burnley -> burnley
+    """
+    return COPY_SUFFIX_RE.sub("", Path(path_str).stem.lower())
+
+
+def canonical_rank(path_str: str, referenced=frozenset()):
+    """
+    Prefer the copy clubs.json uses, then plain names over _retro /
+    _retro2 / _club_1 collision copies, then the biggest file (usually
+    the highest resolution).
+    """
+    p = Path(path_str)
+    suffixed = bool(COPY_SUFFIX_RE.search(p.stem.lower()))
+    return (path_str not in referenced, suffixed, -p.stat().st_size, path_str)
+
+
+def main():
+    files, unhashed = collect_files()
+    print(f"Found {len(files)} images under {LOGO_ROOT}")
+
+    referenced = load_referenced()
+    hashes = compute_hashes(files)
+    groups = find_groups(hashes)
+
+    if COLLAPSE:
+        DUPLICATES_DIR.mkdir(parents=True, exist_ok=True)
+
+    dupes = 0
+    pinned = 0
+    chained = 0
+    shared = 0
+    saved = 0
+
+    for group in groups:
+        # Only copies of the same club are collapsed. The same image under
+        # two different clubs is almost always a bad assignment, and
+        # clubs.json points at both paths, so those are only reported.
+        by_club = {}
+        for path in group:
+            by_club.setdefault(club_key(path), []).append(path)
+
+        if len(by_club) > 1:
+            shared += 1
+            names = ", ".join(str(Path(p).relative_to(LOGO_ROOT)) for p in group)
+            print(f"\n[SHARED] {names} (different clubs — check assignment)")
+
+        for copies in by_club.values():
+            if len(copies) < 2:
+                continue
+
+            copies.sort(key=lambda p: canonical_rank(p, referenced))
+            keep, *others = copies
+            print(f"\n[KEEP] {Path(keep).relative_to(LOGO_ROOT)}")
+
+            for other in others:
+                other_path = Path(other)
+                rel = other_path.relative_to(LOGO_ROOT)
+
+                # Moving it would 404 that club's badge on the dashboard
+                if other in referenced:
+                    pinned += 1
+                    print(f"  [KEPT] {rel} (used in clubs.json)")
+                    continue
+
+                # Only linked through a middle copy: may look quite different
+                if not is_near(hashes[keep], hashes[other]):
+                    chained += 1
+                    print(f"  [CHAINED] {rel} (not close to the kept copy — not moved)")
+                    continue
+
+                dupes += 1
+                saved += other_path.stat().st_size
+
+                if not COLLAPSE:
+                    print(f"  [DUP] {rel}")
+                    continue
+
+                dest = DUPLICATES_DIR / rel
+                if dest.exists():
+                    print(f"  [COLLISION] {rel} already in duplicates — skipping")
+                    continue
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                other_path.rename(dest)
+                print(f"  [MOVED] {rel}")
+
+    print("\n=== SUMMARY ===")
+    print(f"Duplicate groups: {len(groups)}")
+    print(f"Duplicate files: {dupes}")
+    print(f"Kept (used in clubs.json): {pinned}")
+    print(f"Chained, not close to kept copy: {chained}")
+    print(f"Shared across clubs: {shared}")
+    print(f"Reclaimable: {saved / 1024:.1f} KiB")
+    if unhashed:
+        print(f"Not hashed (SVG): {len(unhashed)}")
+        for p in unhashed:
+            print(f"  [UNHASHED] {p.relative_to(LOGO_ROOT)}")
+    if not COLLAPSE:
+        print("Report only — set COLLAPSE = True to move duplicates out")
+
+
+if __name__ == "__main__":
+    main()
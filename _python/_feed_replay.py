@@ -0,0 +1,437 @@
+import html as htmllib
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlparse
+from urllib.request import urlopen
+
+# ================= CONFIG =================
+INDEX_HTML = Path(r"C:\Users\44752\Desktop\Football\index.html")
+CLUBS_JSON = Path(r"C:\Users\44752\Desktop\Football\clubs.json")
+RECORD_DIR = Path(r"C:\Users\44752\Desktop\Football\feed_recordings")
+RESULTS_FILE = Path("replay_results.json")
+
+RSS2JSON = "https://api.rss2json.com/v1/api.json"
+
+FEED_COUNT = 30          # fan-in; recorded feeds are cloned if FEEDS is shorter
+ITEMS_PER_MIN = 100      # new items per feed per simulated minute
+SPEEDUP = 10             # simulated seconds per wall second
+SIM_HOURS = 3            # length of the simulated window
+CLIENTS = 1              # dashboards polling at the same time
+FEED_WINDOW = 20         # items an RSS feed returns per request (newest first)
+REPORT_EVERY_MIN = 15    # simulated minutes between progress lines
+# =========================================
+
+HEADERS = {
+    "User-Agent": "FootballTransferSpyRecorder/1.0 (local script)"
+}
+
+# index.html constants the client loop mirrors (read from the page itself)
+CLIENT_CONSTANTS = ("POLL_EVERY_MS", "FEEDS_PER_TICK", "MAX_ITEMS_PER_FEED", "MAX_RUMOURS_PER_CLUB")
+
+
+# ---------- index.html ----------
+def load_feeds(html: str):
+    """
+    Pull the ["Label", "URL"] pairs out of `const FEEDS = [...]`.
+    """
+    block = re.search(r"const FEEDS = \[(.*?)\n\];", html, re.S)
+    if not block:
+        raise SystemExit("FEEDS not found in index.html")
+    return re.findall(r'\[\s*"([^"]+)"\s*,\s*"([^"]+)"\s*\]', block.group(1))
+
+
+def load_client_constants(html: str):
+    out = {}
+    for name in CLIENT_CONSTANTS:
+        m = re.search(rf"const {name} = (\d+);", html)
+        if not m:
+            raise SystemExit(f"{name} not found in index.html")
+        out[name] = int(m.group(1))
+    return out
+
+
+def recording_path(label: str) -> Path:
+    return RECORD_DIR / (re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_") + ".json")
+
+
+# ---------- record ----------
+def record():
+    import requests
+
+    feeds = load_feeds(INDEX_HTML.read_text(encoding="utf-8"))
+    RECORD_DIR.mkdir(parents=True, exist_ok=True)
+
+    saved = 0
+    for label, url in feeds:
+        try:
+            r = requests.get(RSS2JSON, params={"rss_url": url}, headers=HEADERS, timeout=30)
+            r.raise_for_status()
+            data = r.json()
+        except Exception as e:
+            print(f"  ✗ {label} ({e})")
+            continue
+
+        data["_feed"] = [label, url]
+        recording_path(label).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        saved += 1
+        print(f"  ✓ {label} ({len(data.get('items') or [])} items)")
+        time.sleep(1)  # rss2json free tier rate limit
+
+    print(f"\nRecorded {saved}/{len(feeds)} feeds to {RECORD_DIR.resolve()}")
+
+
+# ---------- stand-in server ----------
+class FeedSource:
+    """
+    One replayed feed. Item n is published at sim time n / rate, so the
+    feed's contents are a pure function of the clock — no writer thread.
+    """
+
+    def __init__(self, label, url, templates):
+        self.label = label
+        self.url = url
+        self.templates = templates
+        self.rate = ITEMS_PER_MIN / 60.0  # items per simulated second
+
+    def items_at(self, sim_now: float, start_wall: float):
+        newest = int(sim_now * self.rate)
+        items = []
+        for n in range(newest, max(-1, newest - FEED_WINDOW), -1):
+            title, link = self.templates[n % len(self.templates)]
+            items.append({
+                # the counter keeps recycled headlines unique
+                "title": f"{title} [{n}]",
+                "link": f"{link}#{n}",
+                "pubDate": f"sim+{n / self.rate:.1f}s",
+                "_published": start_wall + (n / self.rate) / SPEEDUP,
+            })
+        return items
+
+
+def load_sources(feeds, clubs):
+    """
+    Recorded headlines per feed; synthetic ones where nothing was recorded.
+    """
+    sources = []
+    missing = []
+
+    for i in range(FEED_COUNT):
+        label, url = feeds[i % len(feeds)]
+        if i >= len(feeds):
+            label, url = f"{label}#{i // len(feeds) + 1}", f"{url}?copy={i}"
+
+        path = recording_path(feeds[i % len(feeds)][0])
+        templates = []
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            templates = [(it.get("title") or "", it.get("link") or "") for it in data.get("items") or []]
+
+        if not templates:
+            missing.append(label)
+            templates = [
+                (f"{club['name']} in talks over deadline-day move" if j % 3 else "Transfer window latest", f"https://example.invalid/{i}/{j}")
+                for j, club in enumerate(clubs[:50])
+            ]
+
+        sources.append(FeedSource(label, url, templates))
+
+    if missing:
+        print(f"[WARN] No recording for {len(missing)} feeds — using synthetic headlines")
+
+    return sources
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.status = {}
+        self.fetched = 0
+        self.duplicates = 0
+        self.unmatched = 0
+        self.delivered = 0
+        self.latencies = []  # simulated seconds, headline published -> toast
+        self.late_ticks = 0
+        self.memory = []     # (sim minute, client state KiB, seen keys, rumours)
+
+
+def make_server(sources, clock, stats):
+    by_url = {s.url: s for s in sources}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            q = parse_qs(urlparse(self.path).query)
+            source = by_url.get((q.get("rss_url") or [""])[0])
+
+            if source is None:
+                code, body = 404, {"status": "error", "message": "unknown feed"}
+            else:
+                code, body = 200, {"status": "ok", "items": source.items_at(clock.sim_now(), clock.start)}
+
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+            with stats.lock:
+                stats.requests += 1
+                stats.status[code] = stats.status.get(code, 0) + 1
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+
+
+class Clock:
+    def __init__(self):
+        self.start = time.time()
+
+    def sim_now(self) -> float:
+        return (time.time() - self.start) * SPEEDUP
+
+
+# ---------- dashboard client (port of pollTick in index.html) ----------
+def build_matcher(clubs):
+    """
+    Same rules as matchClubByTitle: short aliases need word boundaries,
+    longer ones are plain substring checks, first club wins.
+    """
+    rules = []
+    for club in clubs:
+        checks = []
+        for alias in club.get("aliases") or []:
+            k = (alias or "").lower()
+            if not k:
+                continue
+            if len(k) <= 2:
+                checks.append(re.compile(rf"\b{re.escape(k)}\b", re.I).search)
+            else:
+                checks.append(lambda t, k=k: k in t)
+        rules.append((club, checks))
+
+    def match(title: str):
+        t = (title or "").lower()
+        for club, checks in rules:
+            if any(check(t) for check in checks):
+                return club
+        return None
+
+    return match
+
+
+def decode_entities(text: str) -> str:
+    """
+    decodeHTMLEntities: some feeds arrive double-encoded, so repeat until stable.
+    """
+    out = text or ""
+    for _ in range(4):
+        nxt = htmllib.unescape(out)
+        if nxt == out:
+            break
+        out = nxt
+    return out
+
+
+def client_state_kib(seen, rumours, ticker) -> float:
+    """
+    Size of what the page keeps between ticks (seenKeys, rumoursByClub,
+    ticker text), not of the harness around it.
+    """
+    size = sys.getsizeof(seen) + sum(sys.getsizeof(k) for k in seen)
+    size += sys.getsizeof(rumours) + sys.getsizeof(ticker)
+    for club_id, arr in rumours.items():
+        size += sys.getsizeof(club_id) + sys.getsizeof(arr)
+        for r in arr:
+            size += sys.getsizeof(r) + sum(sys.getsizeof(v) for v in r.values())
+    return round(size / 1024, 1)
+
+
+def seen_key(source, title, link):
+    return f"{source}||{(title or '').strip().lower()}||{(link or '').strip().lower()}"
+
+
+def run_client(sources, base_url, clubs, consts, clock, stats, stop_wall, record_memory):
+    match = build_matcher(clubs)
+    seen = set()
+    rumours = {}
+    ticker = ""
+    feed_index = 0
+
+    tick_wall = consts["POLL_EVERY_MS"] / 1000.0 / SPEEDUP
+    per_tick = consts["FEEDS_PER_TICK"]
+    next_tick = time.time()
+    next_report = REPORT_EVERY_MIN * 60
+
+    while time.time() < stop_wall:
+        batch = [sources[(feed_index + i) % len(sources)] for i in range(per_tick)]
+        feed_index = (feed_index + per_tick) % len(sources)
+
+        for source in batch:
+            try:
+                with urlopen(f"{base_url}?rss_url={quote(source.url, safe='')}", timeout=10) as res:
+                    items = json.loads(res.read()).get("items") or []
+            except Exception:
+                continue  # ignore feed failures, same as the page
+
+            fetched = dupes = unmatched = 0
+            latencies = []
+
+            for item in items[:consts["MAX_ITEMS_PER_FEED"]]:
+                fetched += 1
+                title = item.get("title") or ""
+                link = item.get("link") or ""
+                key = seen_key(source.label, title, link)
+                if key in seen or title in ticker:
+                    dupes += 1
+                    continue
+                seen.add(key)
+
+                title = decode_entities(title)
+                club = match(title)
+                if not club:
+                    unmatched += 1
+                    continue
+
+                arr = rumours.setdefault(club["id"], [])
+                arr.insert(0, {"title": title, "link": link, "source": source.label})
+                del arr[consts["MAX_RUMOURS_PER_CLUB"]:]
+
+                ticker = f"{source.label.upper()}: {title}"
+                # toast shown: this is the end of the pipeline
+                latencies.append((time.time() - item["_published"]) * SPEEDUP)
+
+            with stats.lock:
+                stats.fetched += fetched
+                stats.duplicates += dupes
+                stats.unmatched += unmatched
+                stats.delivered += len(latencies)
+                stats.latencies.extend(latencies)
+
+        sim = clock.sim_now()
+        if record_memory and sim >= next_report:
+            state = client_state_kib(seen, rumours, ticker)
+            kept = sum(len(v) for v in rumours.values())
+            with stats.lock:
+                stats.memory.append((round(sim / 60), state, len(seen), kept))
+                delivered = stats.delivered
+            print(f"  sim {sim / 60:6.0f} min  delivered {delivered:>7}  seen keys {len(seen):>8}  client state {state:>9.1f} KiB")
+            next_report += REPORT_EVERY_MIN * 60
+
+        next_tick += tick_wall
+        delay = next_tick - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            with stats.lock:
+                stats.late_ticks += 1
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[idx], 2)
+
+
+def replay():
+    html = INDEX_HTML.read_text(encoding="utf-8")
+    feeds = load_feeds(html)
+    consts = load_client_constants(html)
+    clubs = json.loads(CLUBS_JSON.read_text(encoding="utf-8"))
+    sources = load_sources(feeds, clubs)
+
+    stats = Stats()
+    clock = Clock()
+    server = make_server(sources, clock, stats)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1/api.json"
+
+    wall_seconds = SIM_HOURS * 3600 / SPEEDUP
+    print(f"Replaying {len(sources)} feeds × {ITEMS_PER_MIN}/min × {SPEEDUP}× for {SIM_HOURS}h simulated "
+          f"({wall_seconds / 60:.1f} min wall), {CLIENTS} client(s)")
+
+    stop_wall = time.time() + wall_seconds
+    clients = [
+        threading.Thread(
+            target=run_client,
+            args=(sources, base_url, clubs, consts, clock, stats, stop_wall, i == 0),
+        )
+        for i in range(CLIENTS)
+    ]
+    for t in clients:
+        t.start()
+    for t in clients:
+        t.join()
+
+    server.shutdown()
+
+    # From the configured window, not the clock: joining clients and
+    # shutting the server down would otherwise count as simulated time.
+    # Item 0 is published at t=0, hence the +1.
+    sim_seconds = SIM_HOURS * 3600
+    sim_minutes = sim_seconds / 60
+    published = (int(sim_seconds * ITEMS_PER_MIN / 60) + 1) * len(sources)
+    lat = stats.latencies
+
+    results = {
+        "config": {
+            "feeds": len(sources), "items_per_min": ITEMS_PER_MIN, "speedup": SPEEDUP,
+            "sim_hours": SIM_HOURS, "clients": CLIENTS, **consts,
+        },
+        "published": published,
+        "requests": stats.requests,
+        "http_status": {str(k): v for k, v in stats.status.items()},
+        "fetched": stats.fetched,
+        "duplicates": stats.duplicates,
+        "unmatched": stats.unmatched,
+        "delivered": stats.delivered,
+        "delivered_per_sim_min": round(stats.delivered / sim_minutes, 2) if sim_minutes else 0,
+        # headlines that scrolled out of the feed before any poll saw them
+        "never_seen_per_client": max(0, published - (stats.fetched - stats.duplicates) // CLIENTS),
+        # share of published headlines each dashboard actually toasted
+        "delivered_ratio": round(stats.delivered / CLIENTS / published, 4) if published else 0,
+        # only over delivered headlines: dropped ones have no latency at all
+        "delivered_latency_sim_s": {p: percentile(lat, p) for p in (50, 90, 99)} | {"max": percentile(lat, 100)},
+        "late_ticks": stats.late_ticks,
+        "memory": stats.memory,
+    }
+
+    RESULTS_FILE.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    print("\n=== SUMMARY ===")
+    print(f"Published: {published}  Fetched: {stats.fetched}  Delivered: {stats.delivered}")
+    print(f"Throughput: {results['delivered_per_sim_min']} toasts / simulated min")
+    lat_s = results["delivered_latency_sim_s"]
+    print(f"Delivered / published (per client): {results['delivered_ratio']:.1%}")
+    print(f"Latency over delivered headlines only (sim s): p50 {lat_s[50]}  p90 {lat_s[90]}  "
+          f"p99 {lat_s[99]}  max {lat_s['max']}")
+    print(f"Never fetched (per client): {results['never_seen_per_client']}")
+    print(f"Late ticks: {stats.late_ticks}")
+    if stats.memory:
+        first, last = stats.memory[0], stats.memory[-1]
+        print(f"Seen keys: {first[2]} -> {last[2]}  Rumours kept: {first[3]} -> {last[3]}  "
+              f"Client state: {first[1]} -> {last[1]} KiB")
+    print(f"Written {RESULTS_FILE.resolve()}")
+
+
+def main():
+    mode = sys.argv[1] if len(sys.argv) > 1 else "replay"
+    if mode == "record":
+        record()
+    elif mode == "replay":
+        replay()
+    else:
+        raise SystemExit("usage: _feed_replay.py [record|replay]")
+
+
+if __name__ == "__main__":
+    main()
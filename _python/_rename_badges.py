@@ -31,22 +31,34 @@ def generate_unique_filename(dest_dir, base_name, ext):
             return candidate
         count += 1
 
-def main():
-    DEST_DIR.mkdir(parents=True, exist_ok=True)
-    ingame_club_keys = load_club_names()
+def plan_moves(files, keys):
+    """
+    Returns ([(file, base_stem)] to move, number skipped) without touching the disk.
+    """
+    plan, skipped = [], 0
 
-    moved, skipped = 0, 0
-
-    for file in SOURCE_DIR.iterdir():
+    for file in files:
         if file.suffix.lower() not in IMAGE_EXTS or not file.is_file():
             continue
 
         base_stem = sanitize(strip_retro_suffix(file.stem))
 
-        if base_stem not in ingame_club_keys:
+        if base_stem not in keys:
             skipped += 1
             continue
 
+        plan.append((file, base_stem))
+
+    return plan, skipped
+
+def main():
+    DEST_DIR.mkdir(parents=True, exist_ok=True)
+    ingame_club_keys = load_club_names()
+
+    plan, skipped = plan_moves(SOURCE_DIR.iterdir(), ingame_club_keys)
+    moved = 0
+
+    for file, base_stem in plan:
         dest_file = generate_unique_filename(DEST_DIR, base_stem + "_club", file.suffix)
         file.rename(dest_file)
         moved += 1